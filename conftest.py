@@ -0,0 +1,33 @@
+"""Shared pytest fixtures for the test suite."""
+
+from http import HTTPStatus
+
+import httpx
+import pytest
+
+
+@pytest.fixture(scope="session")
+def base_request() -> httpx.Request:
+    """Return a canonical request shared by all tests."""
+    return httpx.Request("GET", "http://test.com")
+
+
+@pytest.fixture(scope="session")
+def responses(base_request: httpx.Request) -> dict[HTTPStatus, httpx.Response]:
+    """
+    Return pre-built responses keyed by status code.
+
+    Responses are immutable and never mutated by the tests, so a single
+    session-scoped instance per status code is safe to share.
+    """
+    return {
+        status: httpx.Response(status, request=base_request)
+        for status in (
+            HTTPStatus.UNAUTHORIZED,
+            HTTPStatus.TOO_MANY_REQUESTS,
+            HTTPStatus.FORBIDDEN,
+            HTTPStatus.NOT_FOUND,
+            HTTPStatus.INTERNAL_SERVER_ERROR,
+            HTTPStatus.SERVICE_UNAVAILABLE,
+        )
+    }
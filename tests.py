@@ -1,13 +1,89 @@
 """Tests for ErrorPolicy and HttpxErrorHandler."""
 
+import contextlib
 from http import HTTPStatus
-from unittest.mock import Mock
+from typing import Callable, NoReturn
 
 import httpx
 import pytest
-from pytest_httpx import HTTPXMock
 
-from whackamole import ErrorContext, ErrorPolicy, HttpxWhackamole
+from whackamole import ErrorContext, ErrorPolicy, HttpxWhackamole, handle
+
+# Escalate warnings once for the whole module instead of per-test filters.
+pytestmark = pytest.mark.filterwarnings("error")
+
+# Cache the HTTPStatus members used below: enum attribute access goes through
+# EnumType.__getattr__ and the parametrize tables resolve these repeatedly at
+# collection time. HTTPStatus is an IntEnum, so comparisons are unchanged.
+_UNAUTHORIZED = HTTPStatus.UNAUTHORIZED
+_TOO_MANY_REQUESTS = HTTPStatus.TOO_MANY_REQUESTS
+_FORBIDDEN = HTTPStatus.FORBIDDEN
+_NOT_FOUND = HTTPStatus.NOT_FOUND
+_INTERNAL_SERVER_ERROR = HTTPStatus.INTERNAL_SERVER_ERROR
+_SERVICE_UNAVAILABLE = HTTPStatus.SERVICE_UNAVAILABLE
+
+# Policies shared across parametrize cases. ErrorPolicy is a frozen dataclass,
+# so a single module-level instance is safe to reuse between tests.
+_POLICY_RAISE_404_OR_500 = ErrorPolicy(
+    raise_for_status=(_NOT_FOUND, _INTERNAL_SERVER_ERROR)
+)
+_POLICY_SUPPRESS_404 = ErrorPolicy.raise_all_except(_NOT_FOUND)
+_POLICY_MULTI_SUPPRESS = ErrorPolicy.raise_all_except(
+    _NOT_FOUND, _FORBIDDEN, _SERVICE_UNAVAILABLE
+)
+_POLICY_SUPPRESS_ALL = ErrorPolicy(raise_for_status=())
+_POLICY_CRITICAL_ONLY = ErrorPolicy(
+    raise_for_status=(_UNAUTHORIZED, _TOO_MANY_REQUESTS)
+)
+
+
+# Shared parametrize tables, built once at import so pytest's argvalue
+# handling and ID generation work from a single tuple per table.
+ALL_ERROR_STATUS_PARAMS = (
+    (_UNAUTHORIZED, "Unauthorized"),
+    (_TOO_MANY_REQUESTS, "Rate limited"),
+    (_FORBIDDEN, "Forbidden"),
+    (_NOT_FOUND, "Not found"),
+    (_INTERNAL_SERVER_ERROR, "Server error"),
+)
+INVERTED_SUPPRESS_PARAMS = (
+    (_NOT_FOUND, True),  # Should suppress
+    (_FORBIDDEN, True),  # Should suppress
+    (_SERVICE_UNAVAILABLE, True),  # Should suppress
+    (_INTERNAL_SERVER_ERROR, False),  # Should raise
+)
+
+
+class Recorder:
+    """
+    Minimal callback recorder, a lightweight stand-in for unittest.mock.Mock.
+
+    The callback tests only need a call count and the arguments of each call;
+    Mock's lazy child-mock machinery is overkill for that.
+    """
+
+    __slots__ = ("calls",)
+
+    def __init__(self) -> None:
+        """Start with an empty call log."""
+        self.calls: list[tuple[tuple[object, ...], dict[str, object]]] = []
+
+    def __call__(self, *args: object, **kwargs: object) -> None:
+        """Record the call's positional and keyword arguments."""
+        self.calls.append((args, kwargs))
+
+
+def raise_status_error(response: httpx.Response, msg: str = "Error") -> NoReturn:
+    """
+    Raise an HTTPStatusError built from a pre-constructed response.
+
+    Clears the traceback before raising: the policy tests only assert on
+    handler.error_occurred, so capturing frames for an exception nobody
+    inspects is wasted work.
+    """
+    exc = httpx.HTTPStatusError(msg, request=response.request, response=response)
+    exc.__traceback__ = None
+    raise exc
 
 
 def test_httpstatus_compares_to_httpx_int() -> None:
@@ -31,6 +107,20 @@ def test_error_policy_default() -> None:
     assert policy.suppress_for_status == ()
 
 
+def test_error_policy_default_on_subclass() -> None:
+    """Test that default() on a subclass does not return the shared singleton."""
+
+    class CustomPolicy(ErrorPolicy):
+        pass
+
+    policy = CustomPolicy.default()
+
+    assert type(policy) is CustomPolicy
+    assert policy is not ErrorPolicy.default()
+    assert policy.raise_for_status == "all"
+    assert policy.suppress_for_status == ()
+
+
 def test_httpx_whackamole_no_error_default_policy() -> None:
     """Test that handler works when no error occurs (default policy)."""
     with HttpxWhackamole() as handler:
@@ -40,31 +130,20 @@ def test_httpx_whackamole_no_error_default_policy() -> None:
     assert not handler.error_occurred
 
 
-@pytest.mark.parametrize(
-    ("status_code", "error_message"),
-    [
-        (HTTPStatus.UNAUTHORIZED, "Unauthorized"),
-        (HTTPStatus.TOO_MANY_REQUESTS, "Rate limited"),
-        (HTTPStatus.FORBIDDEN, "Forbidden"),
-        (HTTPStatus.NOT_FOUND, "Not found"),
-        (HTTPStatus.INTERNAL_SERVER_ERROR, "Server error"),
-    ],
-)
+@pytest.mark.parametrize(("status_code", "error_message"), ALL_ERROR_STATUS_PARAMS)
 def test_httpx_whackamole_all_errors_propagate_default_policy(
-    status_code: HTTPStatus, error_message: str
+    status_code: HTTPStatus,
+    error_message: str,
+    responses: dict[HTTPStatus, httpx.Response],
 ) -> None:
     """Test that all errors propagate with default policy (safe by default)."""
-    response = httpx.Response(
-        status_code, request=httpx.Request("GET", "http://test.com")
-    )
+    response = responses[status_code]
 
     with (
         pytest.raises(httpx.HTTPStatusError),
         HttpxWhackamole() as handler,
     ):
-        raise httpx.HTTPStatusError(
-            error_message, request=response.request, response=response
-        )
+        raise_status_error(response, error_message)
 
     # Handler should not have marked it as skippable since it propagated
     assert not handler.error_occurred
@@ -94,7 +173,10 @@ def test_httpx_whackamole_network_errors_propagate_default_policy(
 
 def test_httpx_whackamole_non_http_error() -> None:
     """Test that non-HTTP errors propagate (not suppressed)."""
-    with pytest.raises(ValueError), HttpxWhackamole() as handler:  # noqa: PT011
+    with (
+        pytest.raises(ValueError, match="Not an HTTP error"),
+        HttpxWhackamole() as handler,
+    ):
         msg = "Not an HTTP error"
         raise ValueError(msg)
 
@@ -109,95 +191,88 @@ def test_httpx_whackamole_non_http_error() -> None:
 
 def test_custom_policy_explicit_raise_list() -> None:
     """Test custom policy with explicit list of status codes to raise."""
-    policy = ErrorPolicy(raise_for_status=(HTTPStatus.NOT_FOUND, HTTPStatus.FORBIDDEN))
+    policy = ErrorPolicy(raise_for_status=(_NOT_FOUND, _FORBIDDEN))
 
-    assert HTTPStatus.NOT_FOUND in policy.raise_for_status
-    assert HTTPStatus.FORBIDDEN in policy.raise_for_status
+    assert _NOT_FOUND in policy.raise_for_status
+    assert _FORBIDDEN in policy.raise_for_status
 
 
 @pytest.mark.parametrize(
     "status_code",
-    [HTTPStatus.NOT_FOUND, HTTPStatus.INTERNAL_SERVER_ERROR],
+    [_NOT_FOUND, _INTERNAL_SERVER_ERROR],
 )
-def test_custom_policy_raises_specified_codes(status_code: HTTPStatus) -> None:
+def test_custom_policy_raises_specified_codes(
+    status_code: HTTPStatus, responses: dict[HTTPStatus, httpx.Response]
+) -> None:
     """Test that custom policy raises only specified status codes."""
-    policy = ErrorPolicy(
-        raise_for_status=(HTTPStatus.NOT_FOUND, HTTPStatus.INTERNAL_SERVER_ERROR)
-    )
+    policy = _POLICY_RAISE_404_OR_500
 
-    response = httpx.Response(
-        status_code, request=httpx.Request("GET", "http://test.com")
-    )
+    response = responses[status_code]
     with (
         pytest.raises(httpx.HTTPStatusError),
         HttpxWhackamole(policy=policy) as handler,
     ):
-        msg = "Error"
-        raise httpx.HTTPStatusError(msg, request=response.request, response=response)
+        raise_status_error(response)
     assert not handler.error_occurred
 
 
-def test_custom_policy_suppresses_unspecified_codes() -> None:
+def test_custom_policy_suppresses_unspecified_codes(
+    responses: dict[HTTPStatus, httpx.Response],
+) -> None:
     """Test that custom policy suppresses codes not in raise list."""
-    policy = ErrorPolicy(raise_for_status=(HTTPStatus.NOT_FOUND,))
+    policy = ErrorPolicy(raise_for_status=(_NOT_FOUND,))
 
     # Should suppress 403 (not in raise list)
-    response = httpx.Response(
-        HTTPStatus.FORBIDDEN, request=httpx.Request("GET", "http://test.com")
-    )
+    response = responses[_FORBIDDEN]
     with HttpxWhackamole(policy=policy) as handler:
-        msg = "Forbidden"
-        raise httpx.HTTPStatusError(msg, request=response.request, response=response)
+        raise_status_error(response, "Forbidden")
 
     assert handler.error_occurred
 
 
 def test_error_policy_raise_all_except() -> None:
     """Test ErrorPolicy.raise_all_except() classmethod."""
-    policy = ErrorPolicy.raise_all_except(HTTPStatus.NOT_FOUND, HTTPStatus.FORBIDDEN)
+    policy = ErrorPolicy.raise_all_except(_NOT_FOUND, _FORBIDDEN)
 
     assert policy.raise_for_status == "all"
-    assert HTTPStatus.NOT_FOUND in policy.suppress_for_status
-    assert HTTPStatus.FORBIDDEN in policy.suppress_for_status
+    assert _NOT_FOUND in policy.suppress_for_status
+    assert _FORBIDDEN in policy.suppress_for_status
 
 
-def test_inverted_mode_suppresses_specified_codes() -> None:
+def test_inverted_mode_suppresses_specified_codes(
+    responses: dict[HTTPStatus, httpx.Response],
+) -> None:
     """Test that inverted mode suppresses only the specified codes."""
-    policy = ErrorPolicy.raise_all_except(HTTPStatus.NOT_FOUND)
+    policy = _POLICY_SUPPRESS_404
 
     # Should suppress 404
-    response = httpx.Response(
-        HTTPStatus.NOT_FOUND, request=httpx.Request("GET", "http://test.com")
-    )
+    response = responses[_NOT_FOUND]
     with HttpxWhackamole(policy=policy) as handler:
-        msg = "Not found"
-        raise httpx.HTTPStatusError(msg, request=response.request, response=response)
+        raise_status_error(response, "Not found")
 
     assert handler.error_occurred
 
 
-def test_inverted_mode_raises_unspecified_codes() -> None:
+def test_inverted_mode_raises_unspecified_codes(
+    responses: dict[HTTPStatus, httpx.Response],
+) -> None:
     """Test that inverted mode raises all codes not in suppress list."""
-    policy = ErrorPolicy.raise_all_except(HTTPStatus.NOT_FOUND)
+    policy = _POLICY_SUPPRESS_404
 
     # Should raise 500 (not in suppress list)
-    response = httpx.Response(
-        HTTPStatus.INTERNAL_SERVER_ERROR,
-        request=httpx.Request("GET", "http://test.com"),
-    )
+    response = responses[_INTERNAL_SERVER_ERROR]
     with (
         pytest.raises(httpx.HTTPStatusError),
         HttpxWhackamole(policy=policy) as handler,
     ):
-        msg = "Server error"
-        raise httpx.HTTPStatusError(msg, request=response.request, response=response)
+        raise_status_error(response, "Server error")
 
     assert not handler.error_occurred
 
 
 def test_inverted_mode_raises_network_errors() -> None:
     """Test that inverted mode raises network errors by default."""
-    policy = ErrorPolicy.raise_all_except(HTTPStatus.NOT_FOUND)
+    policy = _POLICY_SUPPRESS_404
 
     # Should raise network errors in inverted mode
     with (
@@ -210,91 +285,77 @@ def test_inverted_mode_raises_network_errors() -> None:
     assert not handler.error_occurred
 
 
-@pytest.mark.parametrize(
-    ("status_code", "should_suppress"),
-    [
-        (HTTPStatus.NOT_FOUND, True),  # Should suppress
-        (HTTPStatus.FORBIDDEN, True),  # Should suppress
-        (HTTPStatus.SERVICE_UNAVAILABLE, True),  # Should suppress
-        (HTTPStatus.INTERNAL_SERVER_ERROR, False),  # Should raise
-    ],
-)
+@pytest.mark.parametrize(("status_code", "should_suppress"), INVERTED_SUPPRESS_PARAMS)
 def test_inverted_mode_multiple_suppress_codes(
-    status_code: HTTPStatus, should_suppress: bool
+    status_code: HTTPStatus,
+    should_suppress: bool,
+    responses: dict[HTTPStatus, httpx.Response],
 ) -> None:
     """Test inverted mode with multiple suppressed codes."""
-    policy = ErrorPolicy.raise_all_except(
-        HTTPStatus.NOT_FOUND, HTTPStatus.FORBIDDEN, HTTPStatus.SERVICE_UNAVAILABLE
-    )
+    policy = _POLICY_MULTI_SUPPRESS
 
-    response = httpx.Response(
-        status_code, request=httpx.Request("GET", "http://test.com")
+    response = responses[status_code]
+
+    raises_ctx = (
+        contextlib.nullcontext()
+        if should_suppress
+        else pytest.raises(httpx.HTTPStatusError)
     )
-    msg = "Error"
-
-    if should_suppress:
-        with HttpxWhackamole(policy=policy) as handler:
-            raise httpx.HTTPStatusError(
-                msg, request=response.request, response=response
-            )
-        assert handler.error_occurred
-    else:
-        with (
-            pytest.raises(httpx.HTTPStatusError),
-            HttpxWhackamole(policy=policy) as handler,
-        ):
-            raise httpx.HTTPStatusError(
-                msg, request=response.request, response=response
-            )
-        assert not handler.error_occurred
+    with raises_ctx, HttpxWhackamole(policy=policy) as handler:
+        raise_status_error(response)
+
+    assert handler.error_occurred is should_suppress
 
 
 @pytest.mark.parametrize(
-    "error_type",
+    ("exc_factory", "expect_suppressed"),
     [
-        "404",  # 404 should be suppressed (file truly missing)
-        "network",  # Network errors should raise (transient)
-        "500",  # 500 errors should raise (transient)
+        # 404 should be suppressed (file truly missing)
+        pytest.param(
+            lambda responses: httpx.HTTPStatusError(
+                "Not found",
+                request=responses[_NOT_FOUND].request,
+                response=responses[_NOT_FOUND],
+            ),
+            True,
+            id="404",
+        ),
+        # Network errors should raise (transient)
+        pytest.param(
+            lambda _responses: httpx.ConnectTimeout("Network timeout"),
+            False,
+            id="network",
+        ),
+        # 500 errors should raise (transient)
+        pytest.param(
+            lambda responses: httpx.HTTPStatusError(
+                "Server error",
+                request=responses[_INTERNAL_SERVER_ERROR].request,
+                response=responses[_INTERNAL_SERVER_ERROR],
+            ),
+            False,
+            id="500",
+        ),
     ],
 )
-def test_verification_policy(error_type: str) -> None:
+def test_verification_policy(
+    exc_factory: Callable[[dict[HTTPStatus, httpx.Response]], httpx.HTTPError],
+    expect_suppressed: bool,
+    responses: dict[HTTPStatus, httpx.Response],
+) -> None:
     """Test verification use case: only 404 is suppressed, others raise."""
-    policy = ErrorPolicy.raise_all_except(HTTPStatus.NOT_FOUND)
-
-    if error_type == "404":
-        response = httpx.Response(
-            HTTPStatus.NOT_FOUND, request=httpx.Request("GET", "http://test.com")
-        )
-        with HttpxWhackamole(policy=policy) as handler:
-            msg = "Not found"
-            raise httpx.HTTPStatusError(
-                msg, request=response.request, response=response
-            )
-        assert handler.error_occurred
-
-    elif error_type == "network":
-        with (
-            pytest.raises(httpx.ConnectTimeout),
-            HttpxWhackamole(policy=policy) as handler,
-        ):
-            msg = "Network timeout"
-            raise httpx.ConnectTimeout(msg)
-        assert not handler.error_occurred
-
-    elif error_type == "500":
-        response = httpx.Response(
-            HTTPStatus.INTERNAL_SERVER_ERROR,
-            request=httpx.Request("GET", "http://test.com"),
-        )
-        with (
-            pytest.raises(httpx.HTTPStatusError),
-            HttpxWhackamole(policy=policy) as handler,
-        ):
-            msg = "Server error"
-            raise httpx.HTTPStatusError(
-                msg, request=response.request, response=response
-            )
-        assert not handler.error_occurred
+    policy = _POLICY_SUPPRESS_404
+    exception = exc_factory(responses)
+
+    raises_ctx = (
+        contextlib.nullcontext()
+        if expect_suppressed
+        else pytest.raises(type(exception))
+    )
+    with raises_ctx, HttpxWhackamole(policy=policy) as handler:
+        raise exception
+
+    assert handler.error_occurred is expect_suppressed
 
 
 # ═══════════════════════════════════════════════════════════════════════════
@@ -302,18 +363,21 @@ def test_verification_policy(error_type: str) -> None:
 # ═══════════════════════════════════════════════════════════════════════════
 
 
-def test_realistic_usage_with_raise_for_status(httpx_mock: HTTPXMock) -> None:
+def test_realistic_usage_with_raise_for_status() -> None:
     """Test realistic usage pattern with raise_for_status()."""
     # Mock successful response
-    httpx_mock.add_response(status_code=200, json={"data": "success"})
+    transport = httpx.MockTransport(
+        lambda _request: httpx.Response(200, json={"data": "success"})
+    )
 
     # Only raise auth and rate-limit errors
-    policy = ErrorPolicy(
-        raise_for_status=(HTTPStatus.UNAUTHORIZED, HTTPStatus.TOO_MANY_REQUESTS)
-    )
+    policy = _POLICY_CRITICAL_ONLY
 
-    with HttpxWhackamole(policy=policy) as handler:
-        response = httpx.get("https://api.example.com/data")
+    with (
+        httpx.Client(transport=transport) as client,
+        HttpxWhackamole(policy=policy) as handler,
+    ):
+        response = client.get("https://api.example.com/data")
         response.raise_for_status()
         if not handler.error_occurred:
             result = response.json()
@@ -322,18 +386,19 @@ def test_realistic_usage_with_raise_for_status(httpx_mock: HTTPXMock) -> None:
     assert result == {"data": "success"}
 
 
-def test_realistic_usage_suppresses_transient_errors(httpx_mock: HTTPXMock) -> None:
+def test_realistic_usage_suppresses_transient_errors() -> None:
     """Test that transient errors (404, 500) are suppressed."""
     # Mock 404 response
-    httpx_mock.add_response(status_code=404)
+    transport = httpx.MockTransport(lambda _request: httpx.Response(404))
 
-    policy = ErrorPolicy(
-        raise_for_status=(HTTPStatus.UNAUTHORIZED, HTTPStatus.TOO_MANY_REQUESTS)
-    )
+    policy = _POLICY_CRITICAL_ONLY
 
     result = None
-    with HttpxWhackamole(policy=policy) as handler:
-        response = httpx.get("https://api.example.com/missing")
+    with (
+        httpx.Client(transport=transport) as client,
+        HttpxWhackamole(policy=policy) as handler,
+    ):
+        response = client.get("https://api.example.com/missing")
         response.raise_for_status()
         if not handler.error_occurred:  # pragma: no cover
             result = response.json()
@@ -342,17 +407,19 @@ def test_realistic_usage_suppresses_transient_errors(httpx_mock: HTTPXMock) -> N
     assert result is None
 
 
-def test_realistic_usage_raises_critical_errors(httpx_mock: HTTPXMock) -> None:
+def test_realistic_usage_raises_critical_errors() -> None:
     """Test that critical errors (401, 429) are raised."""
     # Mock 401 response
-    httpx_mock.add_response(status_code=401)
+    transport = httpx.MockTransport(lambda _request: httpx.Response(401))
 
-    policy = ErrorPolicy(
-        raise_for_status=(HTTPStatus.UNAUTHORIZED, HTTPStatus.TOO_MANY_REQUESTS)
-    )
+    policy = _POLICY_CRITICAL_ONLY
 
-    with pytest.raises(httpx.HTTPStatusError), HttpxWhackamole(policy=policy):
-        response = httpx.get("https://api.example.com/protected")
+    with (
+        pytest.raises(httpx.HTTPStatusError),
+        httpx.Client(transport=transport) as client,
+        HttpxWhackamole(policy=policy),
+    ):
+        response = client.get("https://api.example.com/protected")
         response.raise_for_status()
 
 
@@ -361,40 +428,50 @@ def test_realistic_usage_raises_critical_errors(httpx_mock: HTTPXMock) -> None:
 # ═══════════════════════════════════════════════════════════════════════════
 
 
-def test_on_error_callback_called_when_error_suppressed() -> None:
+@pytest.mark.parametrize(
+    "policy",
+    [
+        # Explicit and single-code inverted policies resolve to different
+        # specialized predicates; exercise both with a callback configured
+        pytest.param(_POLICY_SUPPRESS_ALL, id="explicit-suppress-all"),
+        pytest.param(_POLICY_SUPPRESS_404, id="inverted-single-suppress"),
+    ],
+)
+def test_on_error_callback_called_when_error_suppressed(
+    policy: ErrorPolicy,
+    responses: dict[HTTPStatus, httpx.Response],
+) -> None:
     """Test that on_error callback is invoked when an error is suppressed."""
-    callback = Mock()
-    policy = ErrorPolicy(raise_for_status=())  # Suppress all errors
+    callback = Recorder()
 
-    response = httpx.Response(
-        HTTPStatus.NOT_FOUND, request=httpx.Request("GET", "http://test.com")
-    )
+    response = responses[_NOT_FOUND]
 
     with HttpxWhackamole(policy=policy, on_error=callback) as handler:
         msg = "Not found"
         raise httpx.HTTPStatusError(msg, request=response.request, response=response)
 
     # Callback should have been called
-    callback.assert_called_once()
+    assert len(callback.calls) == 1
 
     # Check the ErrorContext passed to callback
-    ctx: ErrorContext = callback.call_args[0][0]
+    ctx = callback.calls[0][0][0]
+    assert isinstance(ctx, ErrorContext)
     assert isinstance(ctx.exception, httpx.HTTPStatusError)
     assert ctx.was_suppressed is True
-    assert ctx.status_code == HTTPStatus.NOT_FOUND
+    assert ctx.status_code == _NOT_FOUND
     assert ctx.request is not None
     assert ctx.response is not None
     assert handler.error_occurred
 
 
-def test_on_error_callback_called_when_error_raised() -> None:
+def test_on_error_callback_called_when_error_raised(
+    responses: dict[HTTPStatus, httpx.Response],
+) -> None:
     """Test that on_error callback is invoked even when error will be raised."""
-    callback = Mock()
+    callback = Recorder()
     policy = ErrorPolicy.default()  # Raise all errors
 
-    response = httpx.Response(
-        HTTPStatus.NOT_FOUND, request=httpx.Request("GET", "http://test.com")
-    )
+    response = responses[_NOT_FOUND]
 
     with (
         pytest.raises(httpx.HTTPStatusError),
@@ -404,36 +481,37 @@ def test_on_error_callback_called_when_error_raised() -> None:
         raise httpx.HTTPStatusError(msg, request=response.request, response=response)
 
     # Callback should have been called even though error was raised
-    callback.assert_called_once()
+    assert len(callback.calls) == 1
 
     # Check the ErrorContext
-    ctx: ErrorContext = callback.call_args[0][0]
+    ctx = callback.calls[0][0][0]
+    assert isinstance(ctx, ErrorContext)
     assert ctx.was_suppressed is False  # Error was not suppressed
-    assert ctx.status_code == HTTPStatus.NOT_FOUND
+    assert ctx.status_code == _NOT_FOUND
     assert not handler.error_occurred
 
 
 def test_on_success_callback_called_when_no_error() -> None:
     """Test that on_success callback is invoked when no error occurs."""
-    callback = Mock()
+    callback = Recorder()
 
     with HttpxWhackamole(on_success=callback) as handler:
         # No error
         pass
 
-    callback.assert_called_once()
+    assert len(callback.calls) == 1
     assert not handler.error_occurred
 
 
-def test_on_success_callback_not_called_on_error() -> None:
+def test_on_success_callback_not_called_on_error(
+    responses: dict[HTTPStatus, httpx.Response],
+) -> None:
     """Test that on_success callback is NOT invoked when error occurs."""
-    success_callback = Mock()
-    error_callback = Mock()
-    policy = ErrorPolicy(raise_for_status=())  # Suppress all
+    success_callback = Recorder()
+    error_callback = Recorder()
+    policy = _POLICY_SUPPRESS_ALL  # Suppress all
 
-    response = httpx.Response(
-        HTTPStatus.NOT_FOUND, request=httpx.Request("GET", "http://test.com")
-    )
+    response = responses[_NOT_FOUND]
 
     with HttpxWhackamole(
         policy=policy, on_error=error_callback, on_success=success_callback
@@ -441,15 +519,17 @@ def test_on_success_callback_not_called_on_error() -> None:
         msg = "Not found"
         raise httpx.HTTPStatusError(msg, request=response.request, response=response)
 
-    error_callback.assert_called_once()
-    success_callback.assert_not_called()
+    assert len(error_callback.calls) == 1
+    assert not success_callback.calls
     assert handler.error_occurred
 
 
-def test_callbacks_via_subclassing() -> None:
+def test_callbacks_via_subclassing(
+    responses: dict[HTTPStatus, httpx.Response],
+) -> None:
     """Test that callbacks work via subclassing pattern."""
-    error_callback = Mock()
-    success_callback = Mock()
+    error_callback = Recorder()
+    success_callback = Recorder()
 
     class CustomWhackamole(HttpxWhackamole):
         def on_error(self, ctx: ErrorContext) -> None:
@@ -459,42 +539,40 @@ def test_callbacks_via_subclassing() -> None:
             success_callback()
 
     # Test error case
-    policy = ErrorPolicy(raise_for_status=())
-    response = httpx.Response(
-        HTTPStatus.NOT_FOUND, request=httpx.Request("GET", "http://test.com")
-    )
+    policy = _POLICY_SUPPRESS_ALL
+    response = responses[_NOT_FOUND]
 
     with CustomWhackamole(policy=policy):
         msg = "Not found"
         raise httpx.HTTPStatusError(msg, request=response.request, response=response)
 
-    error_callback.assert_called_once()
-    success_callback.assert_not_called()
+    assert len(error_callback.calls) == 1
+    assert not success_callback.calls
 
     # Reset and test success case
-    error_callback.reset_mock()
-    success_callback.reset_mock()
+    error_callback.calls.clear()
+    success_callback.calls.clear()
 
     with CustomWhackamole():
         pass
 
-    success_callback.assert_called_once()
-    error_callback.assert_not_called()
+    assert len(success_callback.calls) == 1
+    assert not error_callback.calls
 
 
-def test_instance_callbacks_override_class_callbacks() -> None:
+def test_instance_callbacks_override_class_callbacks(
+    responses: dict[HTTPStatus, httpx.Response],
+) -> None:
     """Test that instance callbacks override subclass callbacks."""
-    class_error_callback = Mock()
-    instance_error_callback = Mock()
+    class_error_callback = Recorder()
+    instance_error_callback = Recorder()
 
     class CustomWhackamole(HttpxWhackamole):
         def on_error(self, ctx: ErrorContext) -> None:
             class_error_callback(ctx)  # pragma: no cover
 
-    policy = ErrorPolicy(raise_for_status=())
-    response = httpx.Response(
-        HTTPStatus.NOT_FOUND, request=httpx.Request("GET", "http://test.com")
-    )
+    policy = _POLICY_SUPPRESS_ALL
+    response = responses[_NOT_FOUND]
 
     # Pass instance callback to override class callback
     with CustomWhackamole(policy=policy, on_error=instance_error_callback):
@@ -502,24 +580,23 @@ def test_instance_callbacks_override_class_callbacks() -> None:
         raise httpx.HTTPStatusError(msg, request=response.request, response=response)
 
     # Only instance callback should be called
-    instance_error_callback.assert_called_once()
-    class_error_callback.assert_not_called()
+    assert len(instance_error_callback.calls) == 1
+    assert not class_error_callback.calls
 
 
-def test_error_context_for_network_error() -> None:
+def test_error_context_for_network_error(base_request: httpx.Request) -> None:
     """Test that ErrorContext is populated correctly for network errors."""
-    callback = Mock()
-    policy = ErrorPolicy(raise_for_status=())  # Suppress all
-
-    request = httpx.Request("GET", "http://test.com")
+    callback = Recorder()
+    policy = _POLICY_SUPPRESS_ALL  # Suppress all
 
     with HttpxWhackamole(policy=policy, on_error=callback):
         msg = "Connection timeout"
-        raise httpx.ConnectTimeout(msg, request=request)
+        raise httpx.ConnectTimeout(msg, request=base_request)
 
-    callback.assert_called_once()
+    assert len(callback.calls) == 1
 
-    ctx: ErrorContext = callback.call_args[0][0]
+    ctx = callback.calls[0][0][0]
+    assert isinstance(ctx, ErrorContext)
     assert isinstance(ctx.exception, httpx.ConnectTimeout)
     assert ctx.was_suppressed is True
     assert ctx.request is not None
@@ -527,18 +604,161 @@ def test_error_context_for_network_error() -> None:
     assert ctx.status_code is None
 
 
+def test_error_context_for_status_error_subclass(
+    responses: dict[HTTPStatus, httpx.Response],
+) -> None:
+    """Test that extraction falls back to isinstance for HTTPStatusError subclasses."""
+
+    class NotFoundError(httpx.HTTPStatusError):
+        pass
+
+    callback = Recorder()
+    response = responses[_NOT_FOUND]
+
+    with HttpxWhackamole(policy=_POLICY_SUPPRESS_ALL, on_error=callback) as handler:
+        msg = "Not found"
+        raise NotFoundError(msg, request=response.request, response=response)
+
+    assert handler.error_occurred
+    ctx = callback.calls[0][0][0]
+    assert isinstance(ctx, ErrorContext)
+    assert ctx.request is not None
+    assert ctx.response is not None
+    assert ctx.status_code == _NOT_FOUND
+
+
+def test_error_context_for_bare_http_error() -> None:
+    """Test that ErrorContext carries no request/response for a bare HTTPError."""
+    callback = Recorder()
+
+    with HttpxWhackamole(policy=_POLICY_SUPPRESS_ALL, on_error=callback) as handler:
+        msg = "Bare HTTP error"
+        raise httpx.HTTPError(msg)
+
+    assert handler.error_occurred
+    ctx = callback.calls[0][0][0]
+    assert isinstance(ctx, ErrorContext)
+    assert isinstance(ctx.exception, httpx.HTTPError)
+    assert ctx.request is None
+    assert ctx.response is None
+    assert ctx.status_code is None
+
+
 def test_no_callback_invoked_for_non_http_error() -> None:
     """Test that callbacks are not invoked for non-HTTP errors."""
-    error_callback = Mock()
-    success_callback = Mock()
+    error_callback = Recorder()
+    success_callback = Recorder()
 
     with (
-        pytest.raises(ValueError),  # noqa: PT011
+        pytest.raises(ValueError, match="Not an HTTP error"),
         HttpxWhackamole(on_error=error_callback, on_success=success_callback),
     ):
         msg = "Not an HTTP error"
         raise ValueError(msg)
 
     # Neither callback should be called for non-HTTP errors
-    error_callback.assert_not_called()
-    success_callback.assert_not_called()
+    assert not error_callback.calls
+    assert not success_callback.calls
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# HANDLE FUNCTION TESTS
+# ═══════════════════════════════════════════════════════════════════════════
+
+
+def test_handle_returns_result_on_success() -> None:
+    """Test that handle() returns the result and invokes on_success."""
+    callback = Recorder()
+
+    result, error_occurred = handle(lambda: "ok", on_success=callback)
+
+    assert result == "ok"
+    assert not error_occurred
+    assert len(callback.calls) == 1
+
+
+def test_handle_passes_arguments_through() -> None:
+    """Test that handle() forwards positional and keyword arguments."""
+    result, error_occurred = handle(lambda a, b=0: a + b, 1, b=2)
+
+    assert result == 3
+    assert not error_occurred
+
+
+def test_handle_suppresses_error_per_policy(
+    responses: dict[HTTPStatus, httpx.Response],
+) -> None:
+    """Test that handle() suppresses errors according to the policy."""
+    callback = Recorder()
+
+    def fetch() -> None:
+        raise_status_error(responses[_NOT_FOUND], "Not found")
+
+    result, error_occurred = handle(
+        fetch, policy=_POLICY_SUPPRESS_404, on_error=callback
+    )
+
+    assert result is None
+    assert error_occurred
+    ctx = callback.calls[0][0][0]
+    assert isinstance(ctx, ErrorContext)
+    assert ctx.was_suppressed is True
+    assert ctx.status_code == _NOT_FOUND
+
+
+def test_handle_raises_error_per_policy(
+    responses: dict[HTTPStatus, httpx.Response],
+) -> None:
+    """Test that handle() re-raises errors not covered by the policy."""
+
+    def fetch() -> None:
+        raise_status_error(responses[_INTERNAL_SERVER_ERROR], "Server error")
+
+    with pytest.raises(httpx.HTTPStatusError):
+        handle(fetch, policy=_POLICY_SUPPRESS_404)
+
+
+def test_handle_raises_network_error_default_policy() -> None:
+    """Test that handle() re-raises network errors under the default policy."""
+
+    def fetch() -> None:
+        msg = "Connect timeout"
+        raise httpx.ConnectTimeout(msg)
+
+    with pytest.raises(httpx.ConnectTimeout):
+        handle(fetch)
+
+
+def test_handle_suppresses_network_error_explicit_policy(
+    base_request: httpx.Request,
+) -> None:
+    """Test that handle() suppresses network errors in explicit mode."""
+    callback = Recorder()
+
+    def fetch() -> None:
+        msg = "Connect timeout"
+        raise httpx.ConnectTimeout(msg, request=base_request)
+
+    result, error_occurred = handle(
+        fetch, policy=_POLICY_RAISE_404_OR_500, on_error=callback
+    )
+
+    assert result is None
+    assert error_occurred
+    ctx = callback.calls[0][0][0]
+    assert isinstance(ctx, ErrorContext)
+    assert isinstance(ctx.exception, httpx.ConnectTimeout)
+    assert ctx.was_suppressed is True
+    assert ctx.response is None
+
+
+def test_handle_raises_listed_code_explicit_policy(
+    responses: dict[HTTPStatus, httpx.Response],
+) -> None:
+    """Test that handle() raises status codes listed by an explicit policy."""
+
+    def fetch() -> None:
+        raise_status_error(responses[_NOT_FOUND], "Not found")
+
+    with pytest.raises(httpx.HTTPStatusError):
+        handle(fetch, policy=_POLICY_RAISE_404_OR_500)
@@ -9,15 +9,28 @@ immediate attention.
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import TYPE_CHECKING, Callable, Literal
+from typing import TYPE_CHECKING, Any, Callable, Literal, TypeVar, cast
 
 import httpx
 
+# Bind the exception types once at import; the error paths test these on
+# every exception, and a plain module-global load avoids the extra attribute
+# lookup on the httpx module per check.
+_HTTPError = httpx.HTTPError
+_HTTPStatusError = httpx.HTTPStatusError
+_RequestError = httpx.RequestError
+
 if TYPE_CHECKING:
     from http import HTTPStatus
 
+    _Extractor = Callable[
+        [BaseException], "tuple[httpx.Request | None, httpx.Response | None]"
+    ]
+
 __version__ = "1.1.0"
-__all__ = ["ErrorContext", "ErrorPolicy", "HttpxWhackamole"]
+__all__ = ["ErrorContext", "ErrorPolicy", "HttpxWhackamole", "handle"]
+
+_T = TypeVar("_T")
 
 
 @dataclass(frozen=True)
@@ -31,6 +44,9 @@ class ErrorPolicy:
         raise_for_status: Either "all" (raise everything) or tuple of specific status codes to raise
         suppress_for_status: Status codes to suppress when raise_for_status="all" (inverted mode)
 
+    Status codes may be passed as HTTPStatus members or plain ints; they are
+    normalized to plain ints at construction.
+
     Modes:
         1. Inverted mode (default): raise_for_status="all", suppress specific codes via suppress_for_status
         2. Explicit mode: raise_for_status=tuple of codes, suppress everything else
@@ -50,6 +66,55 @@ class ErrorPolicy:
     raise_for_status: tuple[HTTPStatus, ...] | Literal["all"] = field(default="all")
     suppress_for_status: tuple[HTTPStatus, ...] = field(default=())
 
+    # Lookup structures derived once at construction. Plain ints hash to
+    # themselves, so frozenset membership replaces the per-error tuple scan
+    # and the repeated raise_for_status == "all" string comparison.
+    _inverted: bool = field(init=False, repr=False, compare=False)
+    _suppress_ints: frozenset[int] = field(init=False, repr=False, compare=False)
+    _raise_ints: frozenset[int] = field(init=False, repr=False, compare=False)
+    _single_suppress: int | None = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Precompute the decision structures used on the error path."""
+        # The dataclass is frozen, so derived fields go through object.__setattr__
+        inverted = self.raise_for_status == "all"
+        object.__setattr__(self, "_inverted", inverted)
+        # Normalize the public tuples to plain ints once; IntEnum members
+        # compare to ints through the enum machinery, which is slower than
+        # int-to-int comparison, and membership semantics are unchanged
+        if not inverted:
+            object.__setattr__(
+                self,
+                "raise_for_status",
+                tuple(int(code) for code in self.raise_for_status),
+            )
+        object.__setattr__(
+            self,
+            "suppress_for_status",
+            tuple(int(code) for code in self.suppress_for_status),
+        )
+        object.__setattr__(
+            self,
+            "_suppress_ints",
+            frozenset(int(code) for code in self.suppress_for_status),
+        )
+        object.__setattr__(
+            self,
+            "_raise_ints",
+            frozenset()
+            if inverted
+            else frozenset(int(code) for code in self.raise_for_status),
+        )
+        # Scalar fast path for the most common configuration,
+        # raise_all_except(<one code>): a single int compare beats a set probe
+        object.__setattr__(
+            self,
+            "_single_suppress",
+            int(self.suppress_for_status[0])
+            if inverted and len(self.suppress_for_status) == 1
+            else None,
+        )
+
     @classmethod
     def default(cls) -> ErrorPolicy:
         """
@@ -67,6 +132,9 @@ class ErrorPolicy:
         errors by default, developers must consciously decide which errors to handle
         gracefully, reducing the risk of masking important failures.
         """
+        # The policy is immutable, so every caller can share one instance
+        if cls is ErrorPolicy:
+            return _DEFAULT_POLICY
         return cls(raise_for_status="all")
 
     @classmethod
@@ -91,6 +159,11 @@ class ErrorPolicy:
         return cls(raise_for_status="all", suppress_for_status=codes)
 
 
+# Shared default policy: frozen and stateless, so one instance serves every
+# handler constructed without an explicit policy.
+_DEFAULT_POLICY = ErrorPolicy(raise_for_status="all")
+
+
 @dataclass(frozen=True)
 class ErrorContext:
     """
@@ -123,6 +196,287 @@ class ErrorContext:
         return self.response.status_code if self.response else None
 
 
+def _should_raise(policy: ErrorPolicy, exc_val: BaseException) -> bool:
+    """
+    Determine if an error should be raised or suppressed based on a policy.
+
+    Args:
+        policy: The error handling policy to evaluate against
+        exc_val: The exception that was caught
+
+    Returns:
+        True if error should be raised, False if it should be suppressed
+
+    """
+    # Handle network errors (timeouts, connection errors, etc.)
+    if not isinstance(exc_val, _HTTPStatusError):
+        # In inverted mode ("all"), network errors raise by default
+        # In explicit mode, network errors are suppressed
+        return policy._inverted  # noqa: SLF001
+
+    status_code = exc_val.response.status_code
+
+    # Inverted mode: Raise all EXCEPT those in suppress_for_status
+    if policy._inverted:  # noqa: SLF001
+        return status_code not in policy._suppress_ints  # noqa: SLF001
+
+    # Explicit mode: Raise only those in raise_for_status
+    return status_code in policy._raise_ints  # noqa: SLF001
+
+
+def _specialize_should_raise(
+    policy: ErrorPolicy,
+) -> Callable[[BaseException], bool]:
+    """
+    Build a raise/suppress predicate specialized for a fixed policy.
+
+    The policy never changes for the lifetime of a handler, so the mode
+    branch and the code-set lookups can be resolved once here instead of on
+    every exception; the returned closure captures only the relevant
+    frozenset.
+
+    Args:
+        policy: The error handling policy to specialize for
+
+    Returns:
+        Callable mapping an exception to True (raise) or False (suppress)
+
+    """
+    single_suppress = policy._single_suppress  # noqa: SLF001
+    if single_suppress is not None:
+
+        def should_raise_single(exc_val: BaseException) -> bool:
+            # Fast path for raise_all_except(<one code>): one int compare
+            return (
+                not isinstance(exc_val, _HTTPStatusError)
+                or exc_val.response.status_code != single_suppress
+            )
+
+        return should_raise_single
+
+    if policy._inverted:  # noqa: SLF001
+        suppress_ints = policy._suppress_ints  # noqa: SLF001
+
+        def should_raise_inverted(exc_val: BaseException) -> bool:
+            # Raise everything (incl. network errors) except suppressed codes
+            return (
+                not isinstance(exc_val, _HTTPStatusError)
+                or exc_val.response.status_code not in suppress_ints
+            )
+
+        return should_raise_inverted
+
+    raise_ints = policy._raise_ints  # noqa: SLF001
+
+    def should_raise_explicit(exc_val: BaseException) -> bool:
+        # Raise only the listed codes; network errors are suppressed
+        return (
+            isinstance(exc_val, _HTTPStatusError)
+            and exc_val.response.status_code in raise_ints
+        )
+
+    return should_raise_explicit
+
+
+def _extract_status_error(
+    exc_val: httpx.HTTPStatusError,
+) -> tuple[httpx.Request | None, httpx.Response | None]:
+    """Extract request and response from an HTTPStatusError."""
+    return exc_val.request, exc_val.response
+
+
+def _extract_request_error(
+    exc_val: httpx.RequestError,
+) -> tuple[httpx.Request | None, httpx.Response | None]:
+    """Extract the request from a RequestError (which carries no response)."""
+    return exc_val.request, None
+
+
+def _extract_nothing(
+    exc_val: BaseException,  # noqa: ARG001
+) -> tuple[httpx.Request | None, httpx.Response | None]:
+    """Extract nothing from exceptions without request/response attributes."""
+    return None, None
+
+
+# Dispatch table keyed by concrete exception type; missing types are resolved
+# via isinstance once and memoized, so repeated errors of the same type cost a
+# single dict lookup instead of sequential isinstance checks. The typed
+# extractors are safe to widen here because dispatch always goes through the
+# matching isinstance check below.
+_EXTRACTORS: dict[type, _Extractor] = {
+    _HTTPStatusError: cast("_Extractor", _extract_status_error),
+}
+
+
+def _build_error_context(exc_val: BaseException, was_suppressed: bool) -> ErrorContext:
+    """
+    Build an ErrorContext for an exception, extracting request/response.
+
+    Args:
+        exc_val: The exception that occurred
+        was_suppressed: Whether the error was suppressed by policy
+
+    Returns:
+        ErrorContext populated with whatever the exception carries
+
+    """
+    exc_type = type(exc_val)
+    extractor = _EXTRACTORS.get(exc_type)
+    if extractor is None:
+        if isinstance(exc_val, _HTTPStatusError):
+            extractor = cast("_Extractor", _extract_status_error)
+        elif isinstance(exc_val, _RequestError):
+            extractor = cast("_Extractor", _extract_request_error)
+        else:
+            extractor = _extract_nothing
+        _EXTRACTORS[exc_type] = extractor
+
+    request, response = extractor(exc_val)
+
+    return ErrorContext(
+        exception=exc_val,
+        was_suppressed=was_suppressed,
+        request=request,
+        response=response,
+    )
+
+
+# Generated __exit__ implementations, cached by policy decision shape so
+# handlers sharing an equal policy reuse one code object.
+_EXIT_IMPLS: dict[
+    tuple[bool, int | None, frozenset[int], frozenset[int]], Callable[..., bool]
+] = {}
+
+
+def _compile_exit(policy: ErrorPolicy) -> Callable[..., bool]:
+    """
+    Generate a minimal __exit__ implementation for a fixed, callback-free policy.
+
+    Uses the same string-template codegen technique dataclasses use for
+    __init__: the policy mode and status codes are baked into a short linear
+    function body, removing the per-call mode branches and callback checks of
+    the generic exit path. Only valid for handlers without callbacks - those
+    keep the generic implementation.
+
+    Args:
+        policy: The error handling policy to specialize for
+
+    Returns:
+        Function with the signature of __exit__, to be bound per handler
+
+    """
+    inverted = policy._inverted  # noqa: SLF001
+    suppress_ints = policy._suppress_ints  # noqa: SLF001
+    raise_ints = policy._raise_ints  # noqa: SLF001
+    single_suppress = policy._single_suppress  # noqa: SLF001
+
+    key = (inverted, single_suppress, suppress_ints, raise_ints)
+    cached = _EXIT_IMPLS.get(key)
+    if cached is not None:
+        return cached
+
+    lines = [
+        "def _exit(self, exc_type, exc_val, exc_tb):",
+        "    if exc_val is None:",
+        "        return False",
+    ]
+    if inverted:
+        # Everything raises except the suppressed status codes (if any)
+        if single_suppress is not None:
+            condition = f"exc_val.response.status_code == {single_suppress}"
+        elif suppress_ints:
+            condition = "exc_val.response.status_code in _suppress_ints"
+        else:
+            condition = None
+        if condition is not None:
+            lines += [
+                f"    if isinstance(exc_val, _HTTPStatusError) and {condition}:",
+                "        self.error_occurred = True",
+                "        return True",
+            ]
+        lines.append("    return False")
+    else:
+        # Explicit mode: raise only the listed codes, suppress all other
+        # httpx errors (including network errors)
+        lines += [
+            "    if not isinstance(exc_val, _HTTPError):",
+            "        return False",
+            "    if isinstance(exc_val, _HTTPStatusError):",
+            "        if exc_val.response.status_code in _raise_ints:",
+            "            return False",
+            "    self.error_occurred = True",
+            "    return True",
+        ]
+
+    namespace: dict[str, Any] = {
+        "_HTTPError": _HTTPError,
+        "_HTTPStatusError": _HTTPStatusError,
+        "_suppress_ints": suppress_ints,
+        "_raise_ints": raise_ints,
+    }
+    exec("\n".join(lines), namespace)  # noqa: S102
+    impl = _EXIT_IMPLS[key] = cast("Callable[..., bool]", namespace["_exit"])
+    return impl
+
+
+def handle(
+    fn: Callable[..., _T],
+    *args: object,
+    policy: ErrorPolicy | None = None,
+    on_error: Callable[[ErrorContext], None] | None = None,
+    on_success: Callable[[], None] | None = None,
+    **kwargs: object,
+) -> tuple[_T | None, bool]:
+    """
+    Call a function under an error policy without context-manager overhead.
+
+    Functionally equivalent to running ``fn(*args, **kwargs)`` inside
+    ``HttpxWhackamole``, but implemented as a plain ``try``/``except``. On
+    CPython, entering a ``try`` block that raises no exception is free, while
+    a context manager pays for ``__enter__``/``__exit__`` dispatch on every
+    call - prefer this form in tight batch loops doing many requests.
+
+    Args:
+        fn: The callable performing the HTTP operation
+        *args: Positional arguments passed through to fn
+        policy: Error handling policy (default: ErrorPolicy.default())
+        on_error: Optional callback invoked when an error occurs
+        on_success: Optional callback invoked when no error occurs
+        **kwargs: Keyword arguments passed through to fn
+
+    Returns:
+        Tuple of (result, error_occurred). On a suppressed error the result
+        is None and error_occurred is True.
+
+    Example:
+        >>> policy = ErrorPolicy.raise_all_except(HTTPStatus.NOT_FOUND)
+        >>> for url in urls:
+        ...     response, error_occurred = handle(fetch, url, policy=policy)
+        ...     if not error_occurred:
+        ...         process(response)
+
+    """
+    if policy is None:
+        policy = _DEFAULT_POLICY
+
+    try:
+        result = fn(*args, **kwargs)
+    except _HTTPError as exc:
+        should_raise = _should_raise(policy, exc)
+
+        if on_error is not None:
+            on_error(_build_error_context(exc, was_suppressed=not should_raise))
+
+        if should_raise:
+            raise
+        return None, True
+
+    if on_success is not None:
+        on_success()
+    return result, False
+
+
 class HttpxWhackamole:
     """
     Context manager for policy-based httpx error handling.
@@ -168,8 +522,45 @@ class HttpxWhackamole:
 
     """
 
+    # Handlers are often created per request in batch loops; slots drop the
+    # per-instance __dict__ and make attribute access a fixed offset.
+    # Subclasses that need arbitrary attributes should declare their own
+    # __slots__ (or simply omit them to get a __dict__ back).
+    __slots__ = (
+        "_exit_impl",
+        "_on_error",
+        "_on_success",
+        "_should_raise",
+        "error_occurred",
+        "policy",
+    )
+
     error_occurred: bool
     policy: ErrorPolicy
+    _exit_impl: Callable[
+        [type[BaseException] | None, BaseException | None, object], bool
+    ]
+
+    # Class-level callbacks, resolved once per subclass in __init_subclass__
+    # so __init__ reads a plain class attribute instead of running a getattr
+    # descriptor lookup on every construction. The base class defines none.
+    _cls_on_error: Callable[..., None] | None = None
+    _cls_on_success: Callable[..., None] | None = None
+
+    def __init_subclass__(cls, **kwargs: object) -> None:
+        """Cache subclass-defined on_error/on_success callbacks on the class."""
+        super().__init_subclass__(**kwargs)
+
+        # Walk the MRO once at class creation instead of per instance
+        for method_name, cache_name in (
+            ("on_error", "_cls_on_error"),
+            ("on_success", "_cls_on_success"),
+        ):
+            for base in cls.__mro__:
+                method = base.__dict__.get(method_name)
+                if method is not None:
+                    setattr(cls, cache_name, method)
+                    break
 
     def __init__(
         self,
@@ -194,12 +585,28 @@ class HttpxWhackamole:
 
         """
         self.error_occurred = False
-        self.policy = policy or ErrorPolicy.default()
-
-        # Instance callbacks override class-level callbacks
-        # getattr will find subclass methods automatically
-        self._on_error = on_error or getattr(self, "on_error", None)
-        self._on_success = on_success or getattr(self, "on_success", None)
+        self.policy = policy if policy is not None else _DEFAULT_POLICY
+
+        # Specialize the raise/suppress predicate once for the fixed policy
+        self._should_raise = _specialize_should_raise(self.policy)
+
+        # Instance callbacks override class-level callbacks; the latter were
+        # cached per class in __init_subclass__ and are bound here
+        cls = type(self)
+        if on_error is None and cls._cls_on_error is not None:
+            on_error = cls._cls_on_error.__get__(self, cls)
+        if on_success is None and cls._cls_on_success is not None:
+            on_success = cls._cls_on_success.__get__(self, cls)
+        self._on_error = on_error
+        self._on_success = on_success
+
+        # Partial evaluation of __exit__: with no callbacks configured, a
+        # generated exit function with the policy constants baked in replaces
+        # the generic branching version below
+        if on_error is None and on_success is None:
+            self._exit_impl = _compile_exit(self.policy).__get__(self, cls)
+        else:
+            self._exit_impl = self._generic_exit
 
     def __enter__(self) -> HttpxWhackamole:
         """Enter the context manager."""
@@ -212,19 +619,35 @@ class HttpxWhackamole:
         exc_tb: object,
     ) -> bool:
         """Exit the context manager, handling exceptions based on policy."""
+        return self._exit_impl(exc_type, exc_val, exc_tb)
+
+    def _generic_exit(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: object,  # noqa: ARG002
+    ) -> bool:
+        """Handle context exit for handlers with callbacks configured."""
         if exc_type is None or exc_val is None:
-            # No error occurred - call success callback
-            self._invoke_success_callback()
+            # No error occurred - call success callback if one is configured
+            if self._on_success is not None:
+                self._on_success()
             return False
 
-        if not issubclass(exc_type, httpx.HTTPError):
+        # isinstance has a C-level fast path that issubclass lacks, and
+        # exc_val is already verified non-None above
+        if not isinstance(exc_val, _HTTPError):
             return False  # Not an HTTP error, let it propagate
 
         # Determine if we should raise or suppress this error
-        should_raise = self._should_raise_error(exc_val)
+        should_raise = self._should_raise(exc_val)
 
-        # Call error callback with context
-        self._invoke_error_callback(exc_val, was_suppressed=not should_raise)
+        # Call error callback with context; the common no-callback case skips
+        # the ErrorContext allocation entirely
+        if self._on_error is not None:
+            self._on_error(
+                _build_error_context(exc_val, was_suppressed=not should_raise)
+            )
 
         if should_raise:
             return False  # Don't suppress, let it propagate
@@ -232,72 +655,3 @@ class HttpxWhackamole:
         # Mark that error is skippable and suppress it
         self.error_occurred = True
         return True  # Suppress the exception
-
-    def _should_raise_error(self, exc_val: BaseException) -> bool:
-        """
-        Determine if an error should be raised or suppressed based on the policy.
-
-        Args:
-            exc_val: The exception that was caught
-
-        Returns:
-            True if error should be raised, False if it should be suppressed
-
-        """
-        # Handle network errors (timeouts, connection errors, etc.)
-        if not isinstance(exc_val, httpx.HTTPStatusError):
-            # In inverted mode ("all"), network errors raise by default
-            # In explicit mode, network errors are suppressed
-            return self.policy.raise_for_status == "all"
-
-        status_code = exc_val.response.status_code
-
-        # Inverted mode: Raise all EXCEPT those in suppress_for_status
-        if self.policy.raise_for_status == "all":
-            return status_code not in self.policy.suppress_for_status
-
-        # Explicit mode: Raise only those in raise_for_status
-        return status_code in self.policy.raise_for_status
-
-    def _invoke_error_callback(
-        self, exc_val: BaseException, was_suppressed: bool
-    ) -> None:
-        """
-        Invoke the error callback if one is configured.
-
-        Args:
-            exc_val: The exception that occurred
-            was_suppressed: Whether the error was suppressed by policy
-
-        """
-        if self._on_error is None:
-            return
-
-        # Extract request and response from the exception if available
-        request = None
-        response = None
-
-        if isinstance(exc_val, httpx.HTTPStatusError):
-            request = exc_val.request
-            response = exc_val.response
-        elif isinstance(exc_val, httpx.RequestError):
-            request = exc_val.request
-
-        # Create error context and invoke callback
-        context = ErrorContext(
-            exception=exc_val,
-            was_suppressed=was_suppressed,
-            request=request,
-            response=response,
-        )
-
-        # Invoke callback (Python handles bound methods automatically)
-        self._on_error(context)
-
-    def _invoke_success_callback(self) -> None:
-        """Invoke the success callback if one is configured."""
-        if self._on_success is None:
-            return
-
-        # Invoke callback (Python handles bound methods automatically)
-        self._on_success()